@@ -60,6 +60,8 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    # Innermost: O(1) dict dispatch for the parameterless quiz routes
+    'quiz.middleware.FastStaticRouteMiddleware',
 ]
 
 ROOT_URLCONF = 'neuraquiz.urls'
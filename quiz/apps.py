@@ -4,3 +4,14 @@ from django.apps import AppConfig
 class QuizConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'quiz'
+
+    def ready(self):
+        # Warm the URL resolver at boot: walking url_patterns compiles every
+        # route regex and accessing reverse_dict/namespace_dict populates the
+        # reverse caches, so the first incoming request doesn't pay for it.
+        from django.urls import get_resolver
+
+        resolver = get_resolver()
+        resolver.url_patterns
+        resolver.reverse_dict
+        resolver.namespace_dict
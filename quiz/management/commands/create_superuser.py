@@ -4,6 +4,7 @@ Django management command to create the default superuser
 
 from django.core.management.base import BaseCommand
 from django.contrib.auth.models import User
+from django.db import transaction
 from quiz.models import UserProfile
 
 
@@ -14,27 +15,26 @@ class Command(BaseCommand):
         username = 'Shadow'
         email = 'test46ge8g4@gmail.com'
         password = 'SAFjashfh1564.?.'
-        
-        # Check if user already exists
-        if User.objects.filter(username=username).exists():
+
+        # get_or_create fuses the existence check and insert into one
+        # round-trip; atomic keeps the user + profile writes consistent
+        with transaction.atomic():
+            user, created = User.objects.get_or_create(
+                username=username,
+                defaults={'email': email, 'is_staff': True, 'is_superuser': True},
+            )
+            if created:
+                user.set_password(password)
+                user.save(update_fields=['password'])
+
+                # Create user profile with admin role
+                UserProfile.objects.create(user=user, role='admin')
+
+        if created:
+            self.stdout.write(
+                self.style.SUCCESS(f'Successfully created superuser "{username}"')
+            )
+        else:
             self.stdout.write(
                 self.style.WARNING(f'User "{username}" already exists. Skipping creation.')
             )
-            return
-        
-        # Create superuser
-        user = User.objects.create_superuser(
-            username=username,
-            email=email,
-            password=password
-        )
-        
-        # Create user profile with admin role
-        UserProfile.objects.create(
-            user=user,
-            role='admin'
-        )
-        
-        self.stdout.write(
-            self.style.SUCCESS(f'Successfully created superuser "{username}"')
-        )
@@ -1,5 +1,5 @@
 from django.core.management.base import BaseCommand, CommandError
-from quiz.services import gemini_service
+from quiz.services import get_gemini_service
 from quiz.models import Quiz, Question, Choice, AIMetadata
 
 class Command(BaseCommand):
@@ -18,6 +18,7 @@ class Command(BaseCommand):
         except Quiz.DoesNotExist:
             raise CommandError(f'Quiz {quiz_id} not found')
 
+        gemini_service = get_gemini_service()
         if not gemini_service.is_configured:
             self.stderr.write('Gemini service not configured. Aborting.')
             return
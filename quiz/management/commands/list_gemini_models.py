@@ -1,6 +1,17 @@
 from django.core.management.base import BaseCommand
 import json
 
+# Prefer orjson for the dump when available; stdlib json otherwise
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode()
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, indent=2, default=str)
+
+
 class Command(BaseCommand):
     help = 'List Gemini/Generative AI models available to configured client (development only)'
 
@@ -23,7 +34,7 @@ class Command(BaseCommand):
                 collected = models
 
             try:
-                self.stdout.write(json.dumps(collected, indent=2, default=str))
+                self.stdout.write(_dumps(collected))
             except Exception:
                 self.stdout.write(str(collected))
         except Exception as e:
@@ -0,0 +1,55 @@
+"""
+Fast-path dispatch for the parameterless quiz routes.
+
+Django's resolver regex-matches url patterns linearly on every request;
+the fully static paths (home, login, dashboard, ...) can be dispatched
+from a dict in O(1) instead.
+"""
+
+from django.urls import get_resolver, resolve
+from django.urls.resolvers import URLResolver
+
+
+def _static_paths():
+    """Yield every fully static path that maps to a quiz view.
+
+    Walking the resolved URLconf keeps the fast-path table in lockstep
+    with quiz/urls.py: literal prefixes from nested includes accumulate
+    and any pattern that captures arguments is skipped.
+    """
+    def walk(patterns, prefix):
+        for entry in patterns:
+            pattern = entry.pattern
+            if pattern.regex.groups or '<' in str(pattern):
+                continue
+            if isinstance(entry, URLResolver):
+                yield from walk(entry.url_patterns, prefix + str(pattern))
+            elif entry.callback.__module__ == 'quiz.views':
+                yield '/' + prefix + str(pattern)
+
+    yield from walk(get_resolver().url_patterns, '')
+
+
+class FastStaticRouteMiddleware:
+    """Serve parameterless GET/HEAD routes straight from a dict lookup.
+
+    Installed innermost in MIDDLEWARE so every earlier layer (sessions,
+    auth, messages) has already processed the request; anything not in
+    the table falls through to normal URL resolution. Only safe methods
+    take the shortcut so process_view hooks (notably CSRF enforcement)
+    still run for form POSTs to these routes.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        # Pre-resolve each path once so the fast path hands the view a real
+        # ResolverMatch, exactly as the regular resolver would.
+        self._matches = {path: resolve(path) for path in _static_paths()}
+
+    def __call__(self, request):
+        if request.method in ('GET', 'HEAD'):
+            match = self._matches.get(request.path)
+            if match is not None:
+                request.resolver_match = match
+                return match.func(request)
+        return self.get_response(request)
@@ -1,26 +1,53 @@
 from django.db import migrations, models
 import random
-import string
 
 
-def generate_unique_access_code(apps):
-    """Generate a unique 6-digit access code"""
-    UserProfile = apps.get_model('quiz', 'UserProfile')
-    while True:
-        code = ''.join(random.choices(string.digits, k=6))
-        if not UserProfile.objects.filter(quiz_access_code=code).exists():
+def _candidate_codes(needed):
+    """Pre-sample a batch of distinct 6-digit codes to draw from.
+
+    random.sample guarantees the batch itself has no duplicates, so the
+    only collisions left to filter are against codes already in the DB.
+    """
+    return iter(random.sample(range(1_000_000), min(max(needed * 2, 1024), 1_000_000)))
+
+
+def generate_unique_access_code(candidates, used_codes):
+    """Pop the next pre-sampled code that isn't already in use"""
+    for n in candidates:
+        code = f"{n:06d}"
+        if code not in used_codes:
+            used_codes.add(code)
             return code
+    raise RuntimeError('Exhausted candidate access codes')
 
 
 def assign_access_codes_to_existing_instructors(apps, schema_editor):
     """Assign unique access codes to existing instructors"""
     UserProfile = apps.get_model('quiz', 'UserProfile')
-    instructors = UserProfile.objects.filter(role='instructor')
-    
+
+    # Fetch all existing codes once so uniqueness checks stay in memory
+    used_codes = set(
+        UserProfile.objects.exclude(quiz_access_code__isnull=True)
+        .values_list('quiz_access_code', flat=True)
+    )
+
+    needed = UserProfile.objects.filter(
+        role='instructor', quiz_access_code__isnull=True
+    ).count()
+    candidates = _candidate_codes(needed)
+
+    to_update = []
+    instructors = (
+        UserProfile.objects.filter(role='instructor', quiz_access_code__isnull=True)
+        .only('id', 'quiz_access_code')
+        .iterator(chunk_size=2000)
+    )
     for instructor in instructors:
-        if not instructor.quiz_access_code:
-            instructor.quiz_access_code = generate_unique_access_code(apps)
-            instructor.save()
+        instructor.quiz_access_code = generate_unique_access_code(candidates, used_codes)
+        to_update.append(instructor)
+
+    if to_update:
+        UserProfile.objects.bulk_update(to_update, ['quiz_access_code'], batch_size=1000)
 
 
 class Migration(migrations.Migration):
@@ -36,4 +63,4 @@ class Migration(migrations.Migration):
             field=models.CharField(max_length=6, unique=True, null=True, blank=True, help_text='6-digit access code for instructor quizzes'),
         ),
         migrations.RunPython(assign_access_codes_to_existing_instructors, reverse_code=migrations.RunPython.noop),
-    ]
\ No newline at end of file
+    ]
@@ -3,13 +3,147 @@ AI Services for NeuraQuiz
 Handles Gemini API integration for question generation and distractor creation
 """
 
+import asyncio
+import concurrent.futures
+import copy
+import datetime as _dt
+import functools
 import json
+import random
+import time
 from django.conf import settings
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Prefer orjson (Rust-backed, ~3-10x faster decode) for parsing model
+# responses, falling back to the stdlib when it isn't installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+def _strip_fences(s: str) -> str:
+    """Cheaply strip a leading ```/```json fence line and trailing ``` if present."""
+    s = s.strip()
+    if s.startswith('```'):
+        nl = s.find('\n')
+        s = s[nl + 1:] if nl != -1 else ''
+        if '```' in s:
+            s = s.rsplit('```', 1)[0]
+        s = s.strip()
+    return s
+
+
+def _extract_json(raw: str) -> Optional[str]:
+    """Locate the outermost JSON array/object in a model response.
+
+    Strips markdown code fences if present, then walks the text once tracking
+    bracket depth and string/escape state. Linear in the input length, unlike
+    a greedy DOTALL regex which can backtrack badly on long nested output.
+    """
+    raw = _strip_fences(raw)
+
+    starts = [i for i in (raw.find('['), raw.find('{')) if i != -1]
+    if not starts:
+        return None
+    start = min(starts)
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(raw)):
+        ch = raw[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in '[{':
+            depth += 1
+        elif ch in ']}':
+            depth -= 1
+            if depth == 0:
+                return raw[start:i + 1]
+    return None
+
+
+def _iter_cand_texts(response):
+    """Yield text fragments from a response's candidates -> content -> parts.
+
+    A generator so callers can feed str.join directly without staging the
+    fragments in an intermediate list.
+    """
+    for cand in getattr(response, 'candidates', None) or ():
+        # cand.content may be a Content object; try to extract .text or .parts
+        c = getattr(cand, 'content', None) or cand
+        t = getattr(c, 'text', None)
+        if t:
+            yield t
+            continue
+        # try parts
+        for p in getattr(c, 'parts', None) or ():
+            t = getattr(p, 'text', None)
+            if t:
+                yield t
+
+
+# Demo-generation constants: the type cycle is indexed with `i & 3`
+# (bitmask modulo, len is a power of two) so no list is rebuilt per iteration
+_DEMO_QTYPES = ('mcq_single', 'mcq_multiple', 'true_false', 'short_answer')
+_MCQ_CORRECT = {'mcq_single': '1', 'mcq_multiple': '1,2'}
+_DEMO_OPTION_SUFFIXES = ('option 1', 'option 2', 'option 3', 'option 4')
+
+
+@functools.lru_cache(maxsize=256)
+def _demo_questions_cached(topic: str, num_questions: int, difficulty: str) -> tuple:
+    """Build the deterministic demo question list for a (topic, n, difficulty) triple.
+
+    Returned as a tuple so the memoized value is never mutated in place;
+    generate_questions_demo hands out deep copies.
+    """
+    questions = []
+    qtypes = _DEMO_QTYPES
+    # The four MCQ choice strings only vary by topic; build them once
+    mcq_choices = [f"{topic} {o}" for o in _DEMO_OPTION_SUFFIXES]
+    for i in range(num_questions):
+        qtype = qtypes[i & 3]
+        if qtype == 'mcq_single' or qtype == 'mcq_multiple':
+            choices = list(mcq_choices)
+            correct = _MCQ_CORRECT[qtype]
+            questions.append({
+                'question_type': qtype,
+                'question_text': f"{topic} demo question {i+1}",
+                'choices': choices,
+                'correct_answer': correct,
+                'explanation': f"Explanation for {topic} demo question {i+1}"
+            })
+        elif qtype == 'true_false':
+            questions.append({
+                'question_type': 'true_false',
+                'question_text': f"{topic} demo true/false question {i+1}",
+                'choices': [],
+                'correct_answer': 'true' if (i % 2 == 0) else 'false',
+                'explanation': f"Explanation for {topic} demo TF question {i+1}"
+            })
+        else:
+            questions.append({
+                'question_type': 'short_answer',
+                'question_text': f"{topic} demo short answer question {i+1}",
+                'choices': [],
+                'correct_answer': f"Demo answer {i+1}",
+                'explanation': f"Explanation for {topic} demo short question {i+1}"
+            })
+
+    return tuple(questions)
+
 
 class RateLimitError(Exception):
     """Raised when the Gemini API signals a rate limit / quota exceeded condition.
@@ -29,6 +163,66 @@ class RateLimitError(Exception):
         else:
             self.retry_after = None
 
+# Static prompt bodies, built once at import. Literal JSON braces are doubled
+# so the templates stay str.format-ready; methods only pay for the final
+# substitution instead of re-parsing a multi-line f-string per call.
+_QUESTIONS_PROMPT_TMPL = """
+You are an expert quiz content creator. Generate {n} mixed-type questions about the topic: "{topic}" at {difficulty} difficulty.
+
+{extra}
+
+Return MUST be valid JSON only (no extra text). If you include code fences, put the JSON inside triple backticks (```json ... ```).
+
+For each question object include the following fields exactly:
+- question_type: one of ["mcq_single", "mcq_multiple", "true_false", "short_answer"]
+- question_text: string
+- choices: array of strings (for MCQ types, include exactly 4 choices; otherwise empty array)
+- correct_answer: for MCQ, comma-separated indices (0-based) of correct choices; for true_false use "true" or "false"; for short_answer include the answer string
+- explanation: short explanation string
+
+Example output (the model should follow this structure exactly):
+```json
+[
+    {{
+        "question_type": "mcq_single",
+        "question_text": "What is 2+2?",
+        "choices": ["1","2","4","3"],
+        "correct_answer": "2",
+        "explanation": "2+2 equals 4"
+    }}
+]
+```
+"""
+
+_DISTRACTORS_PROMPT_TMPL = """
+            You are an assistant generating high-quality distractors for a quiz.
+
+            Given the correct answer "{correct_answer}" and question "{question_text}",
+            create {n} plausible but incorrect answer options that are not semantically identical.
+
+            Rate each distractor on a scale of 0–1 for plausibility.
+
+            Return JSON with fields: distractor_text, plausibility_score.
+            Output as a JSON array.
+            """
+
+_INSIGHTS_PROMPT_TMPL = """
+            Analyze this quiz performance data and provide insights:
+
+            Quiz: {quiz_title}
+            Score: {score}%
+            Time Taken: {time_taken} seconds
+            Correct Answers: {correct_answers}/{total_questions}
+            Difficulty Distribution: {difficulty_breakdown}
+
+            Provide 3-5 insights in the following format:
+            - insight_type (strength, weakness, recommendation, performance_tip)
+            - content (detailed insight text)
+            - confidence_score (0.0 to 1.0)
+
+            Output as a JSON array.
+            """
+
 # Try to import google.generativeai, fallback if not available
 try:
     import google.generativeai as genai
@@ -40,8 +234,20 @@ except ImportError:
 
 class GeminiService:
     """Service class for interacting with Google Gemini API"""
-    
+
+    _VALID_TYPES = frozenset(('mcq_single', 'mcq_multiple', 'true_false', 'short_answer'))
+
     def __init__(self):
+        self.model = None
+        self._model_ready = False
+        self._configure_client()
+
+    def _configure_client(self):
+        """Cheap client setup: check the library/key and configure genai.
+
+        Model instantiation (and the possible list_models network call) is
+        deferred to _ensure_model so process start isn't blocked by it.
+        """
         self.api_key = settings.GEMINI_API_KEY
         if not GEMINI_AVAILABLE:
             # Use debug-level logging so dev server output isn't noisy when library is missing
@@ -52,77 +258,102 @@ class GeminiService:
             logger.debug("Gemini API key not configured (empty). AI features will be disabled.")
             self.is_configured = False
         else:
-            # Try to configure the client and instantiate the model. If anything fails, mark as not configured
             try:
                 genai.configure(api_key=self.api_key)
-                # If the user set a preferred model name in settings, try it first.
-                preferred = getattr(settings, 'GEMINI_MODEL_NAME', '')
-                model_instantiated = False
-                if preferred:
+                self.is_configured = True
+                logger.info("Gemini service configured (client initialized).")
+            except Exception as e:
+                logger.error(f"Failed to initialize Gemini client: {e}")
+                self.is_configured = False
+
+    def _ensure_model(self) -> bool:
+        """Instantiate a usable model on first use; memoized.
+
+        Flips is_configured off if no model can be found so subsequent calls
+        short-circuit without retrying discovery.
+        """
+        if self._model_ready:
+            return True
+        if not self.is_configured:
+            return False
+
+        try:
+            # If the user set a preferred model name in settings, try it first.
+            preferred = getattr(settings, 'GEMINI_MODEL_NAME', '')
+            model_instantiated = False
+            if preferred:
+                try:
+                    self.model = genai.GenerativeModel(preferred)
+                    model_instantiated = True
+                    logger.info(f"Gemini model initialized using preferred model '{preferred}'")
+                except Exception as e:
+                    logger.warning(f"Preferred Gemini model '{preferred}' failed to initialize: {e}")
+
+            # Try a few common model names (short names are accepted by GenerativeModel which prefixes 'models/')
+            if not model_instantiated:
+                tried_models = ['gemini-2.5-pro', 'gemini-2.5-flash', 'gemini-1.5-flash', 'gemini-2.5-pro-preview-03-25', 'gemini-pro-latest']
+                for mname in tried_models:
                     try:
-                        self.model = genai.GenerativeModel(preferred)
+                        self.model = genai.GenerativeModel(mname)
                         model_instantiated = True
-                        logger.info(f"Gemini model initialized using preferred model '{preferred}'")
-                    except Exception as e:
-                        logger.warning(f"Preferred Gemini model '{preferred}' failed to initialize: {e}")
-
-                # Try a few common model names (short names are accepted by GenerativeModel which prefixes 'models/')
-                if not model_instantiated:
-                    tried_models = ['gemini-2.5-pro', 'gemini-2.5-flash', 'gemini-1.5-flash', 'gemini-2.5-pro-preview-03-25', 'gemini-pro-latest']
-                    for mname in tried_models:
+                        logger.info(f"Gemini model initialized using '{mname}'")
+                        break
+                    except Exception:
+                        continue
+
+            # If still not found, list available models and pick the first that supports generateContent
+            if not model_instantiated:
+                try:
+                    # list_models is a network call; give it a hard 2s budget so a
+                    # hung enumerate endpoint can't stall the first generation request
+                    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+                    try:
+                        entries = executor.submit(genai.list_models).result(timeout=2)
+                    finally:
+                        executor.shutdown(wait=False)
+                    for entry in entries or []:
+                        candidate = None
+                        # Try to get a clean model name from the entry
+                        if isinstance(entry, str):
+                            candidate = entry
+                        elif isinstance(entry, dict):
+                            candidate = entry.get('name') or entry.get('id') or entry.get('model')
+                        else:
+                            candidate = getattr(entry, 'name', None) or getattr(entry, 'id', None)
+
+                        if not candidate:
+                            continue
+
+                        # Only pick models that advertise generateContent
                         try:
-                            self.model = genai.GenerativeModel(mname)
+                            supported = getattr(entry, 'supported_generation_methods', None)
+                            if supported is None and isinstance(entry, dict):
+                                supported = entry.get('supported_generation_methods')
+                            if supported and 'generateContent' not in supported:
+                                continue
+                        except Exception:
+                            pass
+
+                        try:
+                            self.model = genai.GenerativeModel(candidate)
                             model_instantiated = True
-                            logger.info(f"Gemini model initialized using '{mname}'")
+                            logger.info(f"Gemini model initialized using discovered model '{candidate}'")
                             break
                         except Exception:
                             continue
+                except Exception as e:
+                    logger.debug(f"Could not list models: {e}")
 
-                # If still not found, list available models and pick the first that supports generateContent
-                if not model_instantiated:
-                    try:
-                        for entry in genai.list_models() or []:
-                            candidate = None
-                            # Try to get a clean model name from the entry
-                            if isinstance(entry, str):
-                                candidate = entry
-                            elif isinstance(entry, dict):
-                                candidate = entry.get('name') or entry.get('id') or entry.get('model')
-                            else:
-                                candidate = getattr(entry, 'name', None) or getattr(entry, 'id', None)
-
-                            if not candidate:
-                                continue
+            if not model_instantiated:
+                raise RuntimeError('No usable Gemini model found')
+            self._model_ready = True
+            return True
+        except Exception as e:
+            logger.error(f"Failed to initialize Gemini model: {e}")
+            self.is_configured = False
+            return False
 
-                            # Only pick models that advertise generateContent
-                            try:
-                                supported = getattr(entry, 'supported_generation_methods', None)
-                                if supported is None and isinstance(entry, dict):
-                                    supported = entry.get('supported_generation_methods')
-                                if supported and 'generateContent' not in supported:
-                                    continue
-                            except Exception:
-                                pass
-
-                            try:
-                                self.model = genai.GenerativeModel(candidate)
-                                model_instantiated = True
-                                logger.info(f"Gemini model initialized using discovered model '{candidate}'")
-                                break
-                            except Exception:
-                                continue
-                    except Exception as e:
-                        logger.debug(f"Could not list models: {e}")
 
-                if model_instantiated:
-                    self.is_configured = True
-                    logger.info("Gemini service configured (client initialized).")
-                else:
-                    raise RuntimeError('No usable Gemini model found')
-            except Exception as e:
-                logger.error(f"Failed to initialize Gemini client: {e}")
-                self.is_configured = False
-    
     def generate_questions(self, topic: str, num_questions: int = 10, difficulty: str = 'medium', additional_instructions: str = '', debug_save: bool = False) -> List[Dict[str, Any]]:
         """
         Generate quiz questions using Gemini API
@@ -135,38 +366,34 @@ class GeminiService:
         Returns:
             List of generated questions
         """
-        if not self.is_configured:
+        if not self._ensure_model():
             return []
 
         try:
-            prompt = f"""
-You are an expert quiz content creator. Generate {num_questions} mixed-type questions about the topic: "{topic}" at {difficulty} difficulty.
-
-{additional_instructions.strip() if additional_instructions else ''}
-
-Return MUST be valid JSON only (no extra text). If you include code fences, put the JSON inside triple backticks (```json ... ```).
-
-For each question object include the following fields exactly:
-- question_type: one of ["mcq_single", "mcq_multiple", "true_false", "short_answer"]
-- question_text: string
-- choices: array of strings (for MCQ types, include exactly 4 choices; otherwise empty array)
-- correct_answer: for MCQ, comma-separated indices (0-based) of correct choices; for true_false use "true" or "false"; for short_answer include the answer string
-- explanation: short explanation string
-
-Example output (the model should follow this structure exactly):
-```json
-[
-    {{
-        "question_type": "mcq_single",
-        "question_text": "What is 2+2?",
-        "choices": ["1","2","4","3"],
-        "correct_answer": "2",
-        "explanation": "2+2 equals 4"
-    }}
-]
-```
-"""
-            response = self.model.generate_content(prompt)
+            prompt = _QUESTIONS_PROMPT_TMPL.format(
+                n=num_questions,
+                topic=topic,
+                difficulty=difficulty,
+                extra=additional_instructions.strip() if additional_instructions else '',
+            )
+            response = self._call_model(prompt, stream=True)
+
+            # Consume the stream as chunks arrive and stop as soon as the
+            # outermost JSON payload closes, rather than waiting for the
+            # full response to finish generating.
+            raw = None
+            try:
+                chunks = []
+                for ch in response:
+                    text = getattr(ch, 'text', '') or ''
+                    chunks.append(text)
+                    # Only re-scan when a closing bracket could have arrived
+                    if (']' in text or '}' in text) and _extract_json(''.join(chunks)):
+                        break
+                raw = ''.join(chunks)
+            except Exception as e:
+                logger.debug(f"Streaming read failed, falling back to response attributes: {e}")
+                raw = None
 
             # Defensive extraction of text from response. Different SDK versions return the content
             # in different attributes (text, candidates, etc.). Log the raw response for debugging.
@@ -175,29 +402,18 @@ Example output (the model should follow this structure exactly):
             except Exception:
                 pass
 
-            raw = None
-            # Preferred simple attribute
-            if hasattr(response, 'text') and getattr(response, 'text'):
-                raw = response.text
+            # Preferred simple attribute; single getattr instead of
+            # hasattr-then-getattr (each attribute looked up once)
+            if not raw:
+                try:
+                    raw = getattr(response, 'text', None)
+                except Exception:
+                    raw = None
 
             # Try candidates -> content -> parts -> text
-            if not raw and hasattr(response, 'candidates'):
+            if not raw:
                 try:
-                    cand_texts = []
-                    for cand in getattr(response, 'candidates') or []:
-                        # cand.content may be a Content object; try to extract .text or .parts
-                        c = getattr(cand, 'content', None) or cand
-                        if hasattr(c, 'text') and c.text:
-                            cand_texts.append(c.text)
-                        else:
-                            # try parts
-                            parts = getattr(c, 'parts', None)
-                            if parts:
-                                for p in parts:
-                                    if hasattr(p, 'text') and p.text:
-                                        cand_texts.append(p.text)
-                    if cand_texts:
-                        raw = '\n'.join(cand_texts)
+                    raw = '\n'.join(_iter_cand_texts(response)) or None
                 except Exception:
                     raw = None
 
@@ -213,12 +429,17 @@ Example output (the model should follow this structure exactly):
             # Optional one-off debug: save raw model response to a log file for inspection
             if debug_save:
                 try:
-                    import datetime
-                    with open('ai_generation_debug.log', 'a', encoding='utf-8') as f:
-                        f.write('--- AI GENERATION DEBUG ' + datetime.datetime.utcnow().isoformat() + ' UTC ---\n')
-                        f.write(f'Topic: {topic}\nRequested num_questions: {num_questions}\nDifficulty: {difficulty}\n')
-                        f.write('Raw response:\n')
-                        f.write(raw[:10000] + ('\n...[truncated]\n' if len(raw) > 10000 else '\n'))
+                    ts = _dt.datetime.now(_dt.timezone.utc).isoformat(timespec='seconds')
+                    # One buffer, one write: a single encoder pass and syscall
+                    buf = (
+                        f'--- AI GENERATION DEBUG {ts} UTC ---\n'
+                        f'Topic: {topic}\nRequested num_questions: {num_questions}\nDifficulty: {difficulty}\n'
+                        f'Raw response:\n'
+                        f'{raw[:10000]}'
+                        + ('\n...[truncated]\n' if len(raw) > 10000 else '\n')
+                    )
+                    with open('ai_generation_debug.log', 'ab', buffering=65536) as f:
+                        f.write(buf.encode('utf-8'))
                 except Exception:
                     logger.exception('Failed to write AI debug log')
 
@@ -226,107 +447,111 @@ Example output (the model should follow this structure exactly):
                 logger.error('Empty response from Gemini model')
                 return []
 
-            # Extract JSON content from the raw text if model wrapped it in markdown fences or extra text
-            import re
-            json_text = None
-
-            # First try to find a JSON array in the text
-            m = re.search(r"(\[.*\])", raw, flags=re.DOTALL)
-            if m:
-                json_text = m.group(1)
-            else:
-                # Try to find a JSON object (fallback)
-                m2 = re.search(r"(\{.*\})", raw, flags=re.DOTALL)
-                if m2:
-                    json_text = m2.group(1)
-
-            if not json_text:
-                # No JSON detected — attempt to parse the whole text
+            # Fast path: most responses are pure JSON once the fences are
+            # stripped, so try a direct parse before the bracket-depth scanner
+            try:
+                questions_data = _json_loads(_strip_fences(raw))
+            except Exception:
+                # Extract JSON content from the raw text if model wrapped it in extra prose
+                json_text = _extract_json(raw)
                 try:
-                    questions_data = json.loads(raw)
+                    questions_data = _json_loads(json_text if json_text else raw)
                 except Exception as e:
                     logger.error(f"Error parsing model response as JSON. Raw response:\n{raw}\nParse error: {e}")
                     if debug_save:
                         try:
-                            with open('ai_generation_debug.log', 'a', encoding='utf-8') as f:
-                                f.write('--- JSON PARSE ERROR ---\n')
-                                f.write(f'Error: {str(e)}\nRaw text:\n{raw}\n')
-                        except Exception:
-                            pass
-                    return []
-            else:
-                try:
-                    questions_data = json.loads(json_text)
-                except Exception as e:
-                    logger.error(f"Failed to parse extracted JSON from model response. Extracted:\n{json_text}\nError: {e}")
-                    if debug_save:
-                        try:
-                            with open('ai_generation_debug.log', 'a', encoding='utf-8') as f:
-                                f.write('--- JSON PARSE ERROR ---\n')
-                                f.write(f'Error: {str(e)}\nExtracted JSON:\n{json_text}\n')
+                            with open('ai_generation_debug.log', 'ab', buffering=65536) as f:
+                                f.write(f'--- JSON PARSE ERROR ---\nError: {str(e)}\nRaw text:\n{raw}\n'.encode('utf-8'))
                         except Exception:
                             pass
                     return []
 
-            # Validate, deduplicate and cap the data to requested number
-            validated_questions = []
-            seen_texts = set()
-            if isinstance(questions_data, list):
-                for q in questions_data:
-                    if not self._validate_question(q):
-                        continue
-                    # Deduplicate by normalized question text
-                    text_norm = (q.get('question_text') or '').strip().lower()
-                    if text_norm in seen_texts:
-                        continue
-                    seen_texts.add(text_norm)
-                    validated_questions.append(q)
-                    if len(validated_questions) >= int(num_questions):
-                        break
-            else:
+            # Validate, deduplicate and cap the data to requested number.
+            # A single dict keyed on normalized text fuses the dedup set and
+            # the output list; casefold() is Unicode-correct and no-ops on
+            # already-lowercase ASCII.
+            if not isinstance(questions_data, list):
                 logger.error(f"Model returned JSON but it was not a list: {type(questions_data)}")
                 return []
 
+            uniq: Dict[str, Dict[str, Any]] = {}
+            cap = int(num_questions)
+            for q in questions_data:
+                if not self._validate_question(q):
+                    continue
+                key = q['question_text'].strip().casefold()
+                if key in uniq:
+                    continue
+                uniq[key] = q
+                if len(uniq) >= cap:
+                    break
+
             # If the model returned fewer unique questions than requested, that's okay.
-            return validated_questions
+            return list(uniq.values())
         except Exception as e:
             logger.error(f"Error generating questions: {str(e)}")
             return []
 
+    def _call_model(self, prompt: str, max_retries: int = 3, base: float = 1.0, cap: float = 30.0, stream: bool = False):
+        """Call generate_content with exponential backoff + jitter on transient errors.
+
+        Retries on rate-limit/quota (429) and 5xx-style failures; honors a
+        server-provided retry_after when the error message carries one. The
+        last attempt's exception propagates so callers keep their existing
+        error handling.
+        """
+        last_exc = None
+        for attempt in range(max_retries):
+            try:
+                return self.model.generate_content(prompt, stream=stream)
+            except Exception as e:
+                msg = str(e).lower()
+                recoverable = any(token in msg for token in ('429', 'quota', 'rate limit', '500', '503', 'unavailable', 'deadline'))
+                if not recoverable:
+                    raise
+                last_exc = e
+                if attempt == max_retries - 1:
+                    break
+                retry_after = getattr(e, 'retry_after', None)
+                if retry_after:
+                    delay = min(cap, float(retry_after))
+                else:
+                    delay = min(cap, base * 2 ** attempt) * (1 + random.random() * 0.5)
+                logger.warning(f"Gemini call failed (attempt {attempt + 1}/{max_retries}), retrying in {delay:.1f}s: {e}")
+                time.sleep(delay)
+        raise RateLimitError(str(last_exc), retry_after=getattr(last_exc, 'retry_after', None))
+
+    async def generate_questions_batch(self, specs: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Generate questions for several quizzes concurrently.
+
+        Args:
+            specs: List of kwargs dicts for generate_questions
+                   (topic, num_questions, difficulty, ...)
+
+        Returns:
+            List of question lists, in the same order as specs. Individual
+            failures return [] just like generate_questions does.
+        """
+        if not self.is_configured:
+            return [[] for _ in specs]
+
+        # Bound concurrency so a large batch doesn't hammer the API quota
+        sem = asyncio.Semaphore(8)
+
+        async def _one(spec):
+            async with sem:
+                return await asyncio.to_thread(self.generate_questions, **spec)
+
+        return list(await asyncio.gather(*(_one(spec) for spec in specs)))
+
     def generate_questions_demo(self, topic: str, num_questions: int = 10, difficulty: str = 'medium') -> List[Dict[str, Any]]:
         """Generate simple demo questions locally when Gemini is not available."""
-        questions = []
-        for i in range(int(num_questions)):
-            qtype = ['mcq_single', 'mcq_multiple', 'true_false', 'short_answer'][i % 4]
-            if qtype == 'mcq_single' or qtype == 'mcq_multiple':
-                choices = [f"{topic} option {j+1}" for j in range(4)]
-                correct = '1' if qtype == 'mcq_single' else '1,2'
-                questions.append({
-                    'question_type': qtype,
-                    'question_text': f"{topic} demo question {i+1}",
-                    'choices': choices,
-                    'correct_answer': correct,
-                    'explanation': f"Explanation for {topic} demo question {i+1}"
-                })
-            elif qtype == 'true_false':
-                questions.append({
-                    'question_type': 'true_false',
-                    'question_text': f"{topic} demo true/false question {i+1}",
-                    'choices': [],
-                    'correct_answer': 'true' if (i % 2 == 0) else 'false',
-                    'explanation': f"Explanation for {topic} demo TF question {i+1}"
-                })
-            else:
-                questions.append({
-                    'question_type': 'short_answer',
-                    'question_text': f"{topic} demo short answer question {i+1}",
-                    'choices': [],
-                    'correct_answer': f"Demo answer {i+1}",
-                    'explanation': f"Explanation for {topic} demo short question {i+1}"
-                })
-
-        return questions
-    
+        # Output is deterministic per (topic, num_questions, difficulty), so
+        # serve deep copies of a memoized result instead of rebuilding dicts.
+        return copy.deepcopy(list(_demo_questions_cached(topic, int(num_questions), difficulty)))
+
+
     def generate_distractors(self, question_text: str, correct_answer: str, num_distractors: int = 3) -> List[Dict[str, Any]]:
         """
         Generate plausible distractors for a given correct answer
@@ -339,24 +564,18 @@ Example output (the model should follow this structure exactly):
         Returns:
             List of generated distractors with plausibility scores
         """
-        if not self.is_configured:
+        if not self._ensure_model():
             return []
         
         try:
-            prompt = f"""
-            You are an assistant generating high-quality distractors for a quiz.
-            
-            Given the correct answer "{correct_answer}" and question "{question_text}",
-            create {num_distractors} plausible but incorrect answer options that are not semantically identical.
-            
-            Rate each distractor on a scale of 0–1 for plausibility.
-            
-            Return JSON with fields: distractor_text, plausibility_score.
-            Output as a JSON array.
-            """
-            
-            response = self.model.generate_content(prompt)
-            distractors_data = json.loads(response.text)
+            prompt = _DISTRACTORS_PROMPT_TMPL.format(
+                correct_answer=correct_answer,
+                question_text=question_text,
+                n=num_distractors,
+            )
+
+            response = self._call_model(prompt)
+            distractors_data = _json_loads(response.text)
             
             # Filter out distractors with low plausibility scores
             filtered_distractors = [
@@ -380,29 +599,21 @@ Example output (the model should follow this structure exactly):
         Returns:
             List of AI insights
         """
-        if not self.is_configured:
+        if not self._ensure_model():
             return []
         
         try:
-            prompt = f"""
-            Analyze this quiz performance data and provide insights:
-            
-            Quiz: {attempt_data.get('quiz_title', 'Unknown')}
-            Score: {attempt_data.get('score', 0)}%
-            Time Taken: {attempt_data.get('time_taken', 0)} seconds
-            Correct Answers: {attempt_data.get('correct_answers', 0)}/{attempt_data.get('total_questions', 0)}
-            Difficulty Distribution: {attempt_data.get('difficulty_breakdown', {})}
-            
-            Provide 3-5 insights in the following format:
-            - insight_type (strength, weakness, recommendation, performance_tip)
-            - content (detailed insight text)
-            - confidence_score (0.0 to 1.0)
-            
-            Output as a JSON array.
-            """
-            
-            response = self.model.generate_content(prompt)
-            insights_data = json.loads(response.text)
+            prompt = _INSIGHTS_PROMPT_TMPL.format(
+                quiz_title=attempt_data.get('quiz_title', 'Unknown'),
+                score=attempt_data.get('score', 0),
+                time_taken=attempt_data.get('time_taken', 0),
+                correct_answers=attempt_data.get('correct_answers', 0),
+                total_questions=attempt_data.get('total_questions', 0),
+                difficulty_breakdown=attempt_data.get('difficulty_breakdown', {}),
+            )
+
+            response = self._call_model(prompt)
+            insights_data = _json_loads(response.text)
             
             return insights_data
             
@@ -412,22 +623,25 @@ Example output (the model should follow this structure exactly):
     
     def _validate_question(self, question: Dict[str, Any]) -> bool:
         """Validate a generated question"""
-        required_fields = ['question_type', 'question_text', 'correct_answer']
-        
-        # Check required fields
-        for field in required_fields:
-            if field not in question or not question[field]:
-                return False
-        
-        # Validate question type
-        valid_types = ['mcq_single', 'mcq_multiple', 'true_false', 'short_answer']
-        if question['question_type'] not in valid_types:
-            return False
-        
+        # Required fields must be present and truthy; type must be known.
         # No difficulty_score validation needed; only difficulty word is used
-        
-        return True
-
-
-# Global instance
-gemini_service = GeminiService()
+        get = question.get
+        return (
+            bool(get('question_text'))
+            and bool(get('correct_answer'))
+            and get('question_type') in self._VALID_TYPES
+        )
+
+
+# Shared instance, built lazily: constructing GeminiService touches the
+# network in the worst case, so don't pay that at import time in processes
+# (tests, management commands) that never use AI features.
+_gemini_service = None
+
+
+def get_gemini_service() -> GeminiService:
+    """Return the shared GeminiService, constructing it on first use."""
+    global _gemini_service
+    if _gemini_service is None:
+        _gemini_service = GeminiService()
+    return _gemini_service
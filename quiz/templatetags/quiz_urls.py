@@ -0,0 +1,11 @@
+from django import template
+
+from quiz.urls_cache import rev
+
+register = template.Library()
+
+
+@register.simple_tag
+def crev(name, **kwargs):
+    """Cached {% url %} for routes whose result never changes per process."""
+    return rev(name, **kwargs)
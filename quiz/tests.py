@@ -49,3 +49,20 @@ class AddQuestionTests(TestCase):
 		# should redirect back to edit page
 		self.assertEqual(resp.status_code, 302)
 		self.assertEqual(self.quiz.questions.count(), 1)
+
+
+class FastStaticRouteMiddlewareTests(TestCase):
+	def test_table_matches_urlconf(self):
+		# every fast-path entry must dispatch to the same view the
+		# regular resolver would pick for that path
+		from django.urls import resolve
+		from .middleware import FastStaticRouteMiddleware
+		middleware = FastStaticRouteMiddleware(lambda request: None)
+		self.assertTrue(middleware._matches)
+		for path, match in middleware._matches.items():
+			self.assertIs(resolve(path).func, match.func, path)
+
+	def test_fast_path_sets_resolver_match(self):
+		resp = self.client.get('/')
+		self.assertEqual(resp.status_code, 200)
+		self.assertEqual(resp.wsgi_request.resolver_match.url_name, 'home')
@@ -2,6 +2,7 @@ from django.test import TestCase, Client
 from django.contrib.auth.models import User
 from unittest.mock import patch
 from .models import Quiz
+import asyncio
 import json
 
 class GeminiMock:
@@ -31,9 +32,10 @@ class GenerateQuestionsDedupCapTests(TestCase):
             })
         return qs
 
-    @patch('quiz.views.gemini_service')
-    def test_generate_respects_requested_count_and_dedupes(self, mock_service):
-        # Mock gemini_service.generate_questions to return 10 items (with duplicates every 5)
+    @patch('quiz.views.get_gemini_service')
+    def test_generate_respects_requested_count_and_dedupes(self, mock_get_service):
+        # Mock the service accessor to return 10 items (with duplicates every 5)
+        mock_service = mock_get_service.return_value
         mock_service.is_configured = True
         mock_service.generate_questions.return_value = self._make_mock_questions(10)
 
@@ -64,4 +66,24 @@ class GenerateQuestionsDedupCapTests(TestCase):
         except FileNotFoundError:
             # It's acceptable if debug logging isn't available in this environment
             pass
- 
\ No newline at end of file
+
+class GenerateQuestionsBatchTests(TestCase):
+    def _service(self, configured):
+        from .services import GeminiService
+        service = GeminiService.__new__(GeminiService)
+        service.is_configured = configured
+        return service
+
+    def test_unconfigured_returns_empty_list_per_spec(self):
+        service = self._service(configured=False)
+        specs = [{'topic': 'a'}, {'topic': 'b'}, {'topic': 'c'}]
+        result = asyncio.run(service.generate_questions_batch(specs))
+        self.assertEqual(result, [[], [], []])
+
+    def test_results_follow_spec_order(self):
+        service = self._service(configured=True)
+        specs = [{'topic': 'alpha'}, {'topic': 'beta'}, {'topic': 'gamma'}]
+        with patch.object(service, 'generate_questions',
+                          side_effect=lambda **spec: [spec['topic']]):
+            result = asyncio.run(service.generate_questions_batch(specs))
+        self.assertEqual(result, [['alpha'], ['beta'], ['gamma']])
@@ -0,0 +1,17 @@
+"""
+Memoized reverse() lookups for NeuraQuiz URL names.
+
+Argument-less routes (home, login, dashboard, ...) always reverse to the
+same string, so the resolver scan is paid once per name and every later
+call is a dict hit.
+"""
+
+from functools import lru_cache
+
+from django.urls import reverse
+
+
+@lru_cache(maxsize=64)
+def rev(name, **kwargs):
+    """reverse() memoized on (name, kwargs)."""
+    return reverse(name, kwargs=kwargs or None)
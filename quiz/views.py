@@ -16,7 +16,7 @@ from .models import (
     UserProfile, Quiz, Question, Choice, AIMetadata, 
     QuizAttempt, UserAnswer, AIInsight
 )
-from .services import gemini_service, RateLimitError
+from .services import get_gemini_service, RateLimitError
 from django.core.cache import cache
 import logging
 
@@ -232,7 +232,7 @@ def edit_quiz(request, quiz_id):
         'questions': questions,
         'ai_generated_count': ai_generated_count,
         # expose whether the Gemini service is available so templates can disable UI
-        'ai_enabled': gemini_service.is_configured,
+        'ai_enabled': get_gemini_service().is_configured,
     }
     return render(request, 'quiz/edit_quiz.html', context)
 
@@ -309,6 +309,7 @@ def generate_ai_questions(request, quiz_id):
     if request.method != 'POST':
         return JsonResponse({'error': 'Invalid request method'}, status=405)
 
+    gemini_service = get_gemini_service()
     if not gemini_service.is_configured:
         return JsonResponse({'error': 'AI service not configured.'}, status=503)
 
@@ -941,6 +942,7 @@ def _check_answer(question, answer_text, selected_choice_ids):
 
 def _generate_quiz_insights(attempt):
     """Generate AI insights for quiz performance"""
+    gemini_service = get_gemini_service()
     if not gemini_service.is_configured:
         return
     
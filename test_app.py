@@ -1,139 +1,106 @@
-#!/usr/bin/env python
 """
-Simple test script to verify NeuraQuiz application is working correctly
+Smoke tests verifying the NeuraQuiz application is working correctly.
+
+Run with `pytest` (settings come from pytest.ini) or via
+`python manage.py test test_app` — no hand-rolled django.setup() needed.
 """
 
-import os
+import asyncio
 import sys
-import django
 
-# Add the project directory to Python path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from django.test import AsyncClient, TestCase
+from django.contrib.auth import get_user_model
+from quiz.models import UserProfile, Quiz, Question, Choice
 
-# Set up Django environment
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'neuraquiz.settings')
-django.setup()
+User = get_user_model()
 
-from django.test import TestCase, Client
-from django.contrib.auth.models import User
-from django.urls import reverse
-from quiz.models import UserProfile, Quiz, Question, Choice
 
-def test_basic_functionality():
-    """Test basic application functionality"""
-    print("Testing NeuraQuiz Application...")
-    
-    # Test 1: Check if superuser exists
-    print("\n1. Testing superuser creation...")
-    try:
-        shadow_user = User.objects.get(username='Shadow')
-        print("SUCCESS: Superuser 'Shadow' exists")
-        
-        # Check if user profile exists
-        profile = UserProfile.objects.get(user=shadow_user)
-        print(f"SUCCESS: User profile created with role: {profile.role}")
-    except User.DoesNotExist:
-        print("ERROR: Superuser 'Shadow' not found")
-        return False
-    
-    # Test 2: Test URL routing
-    print("\n2. Testing URL routing...")
-    client = Client()
-    
-    # Test home page
-    response = client.get('/')
-    if response.status_code == 200:
-        print("SUCCESS: Home page loads successfully")
-    else:
-        print(f"ERROR: Home page failed with status: {response.status_code}")
-    
-    # Test login page
-    response = client.get('/login/')
-    if response.status_code == 200:
-        print("SUCCESS: Login page loads successfully")
-    else:
-        print(f"ERROR: Login page failed with status: {response.status_code}")
-    
-    # Test register page
-    response = client.get('/register/')
-    if response.status_code == 200:
-        print("SUCCESS: Register page loads successfully")
-    else:
-        print(f"ERROR: Register page failed with status: {response.status_code}")
-    
-    # Test 3: Test authentication
-    print("\n3. Testing authentication...")
-    login_success = client.login(username='Shadow', password='Qwerty123')
-    if login_success:
-        print("SUCCESS: Superuser login successful")
-        
-        # Test dashboard access
-        response = client.get('/dashboard/')
-        if response.status_code == 200:
-            print("SUCCESS: Dashboard accessible after login")
-        else:
-            print(f"ERROR: Dashboard failed with status: {response.status_code}")
-    else:
-        print("ERROR: Superuser login failed")
-    
-    # Test 4: Test model creation
-    print("\n4. Testing model creation...")
-    try:
-        # Create a test quiz
-        quiz = Quiz.objects.create(
+def _emit(lines):
+    """Flush status lines in one stdout write instead of one per print."""
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+
+class NeuraQuizSmokeTest(TestCase):
+    """Basic application smoke checks.
+
+    Fixtures are created once per class via setUpTestData and cleaned up by
+    the test runner's transaction rollback — no manual delete() cascades.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.shadow_user = User.objects.create_superuser(
+            username='Shadow',
+            email='shadow@example.com',
+            password='Qwerty123',
+        )
+        cls.profile = UserProfile.objects.create(user=cls.shadow_user, role='admin')
+
+        cls.quiz = Quiz.objects.create(
             title="Test Quiz",
             topic="Testing",
             difficulty="medium",
             time_limit=30,
-            created_by=shadow_user
+            created_by=cls.shadow_user,
         )
-        print("SUCCESS: Quiz model creation successful")
-        
-        # Create a test question
-        question = Question.objects.create(
-            quiz=quiz,
+        cls.question = Question.objects.create(
+            quiz=cls.quiz,
             text="What is 2 + 2?",
             question_type="mcq_single",
-            correct_answer="0",
-            difficulty_score=1.0
+            correct_answer="1",
         )
-        print("SUCCESS: Question model creation successful")
-        
-        # Create test choices
-        Choice.objects.create(
-            question=question,
-            choice_text="3",
-            is_correct=False,
-            order=0
-        )
-        Choice.objects.create(
-            question=question,
-            choice_text="4",
-            is_correct=True,
-            order=1
-        )
-        print("SUCCESS: Choice model creation successful")
-        
-        # Clean up test data
-        quiz.delete()
-        print("SUCCESS: Test data cleaned up")
-        
-    except Exception as e:
-        print(f"ERROR: Model creation failed: {e}")
-        return False
-    
-    print("\nAll tests passed! NeuraQuiz is working correctly.")
-    return True
-
-if __name__ == "__main__":
-    success = test_basic_functionality()
-    if success:
-        print("\nApplication is ready to use!")
-        print("\nTo start the server, run: python manage.py runserver")
-        print("Then visit: http://127.0.0.1:8000")
-        print("\nLogin credentials:")
-        print("   Username: Shadow")
-        print("   Password: Qwerty123")
-    else:
-        print("\nSome tests failed. Please check the errors above.")
-        sys.exit(1)
+        # One INSERT for both choices instead of one per row
+        Choice.objects.bulk_create([
+            Choice(question=cls.question, choice_text="3", is_correct=False, order=0),
+            Choice(question=cls.question, choice_text="4", is_correct=True, order=1),
+        ])
+
+    def test_superuser_and_profile(self):
+        """Superuser and its profile exist"""
+        out = []
+        shadow_user = User.objects.get(username='Shadow')
+        out.append("SUCCESS: Superuser 'Shadow' exists")
+        profile = UserProfile.objects.get(user=shadow_user)
+        out.append(f"SUCCESS: User profile created with role: {profile.role}")
+        self.assertEqual(profile.role, 'admin')
+        _emit(out)
+
+    PAGES = (('/', 'Home'), ('/login/', 'Login'), ('/register/', 'Register'))
+
+    async def test_public_pages_load(self):
+        """Public pages respond with 200"""
+        # Fan the GETs out concurrently; the event loop overlaps template
+        # loading and rendering across the sibling requests. Declared async
+        # so the test runner keeps the views on the test DB connection.
+        client = AsyncClient()
+        responses = await asyncio.gather(*(client.get(url) for url, _ in self.PAGES))
+
+        out = []
+        for (url, label), response in zip(self.PAGES, responses):
+            with self.subTest(url=url):
+                self.assertEqual(response.status_code, 200, f"{label} page failed")
+                out.append(f"SUCCESS: {label} page loads successfully")
+        _emit(out)
+
+    def test_authentication_and_dashboard(self):
+        """Superuser can log in and reach the dashboard"""
+        out = []
+        login_success = self.client.login(username='Shadow', password='Qwerty123')
+        self.assertTrue(login_success)
+        out.append("SUCCESS: Superuser login successful")
+
+        response = self.client.get('/dashboard/')
+        self.assertEqual(response.status_code, 200)
+        out.append("SUCCESS: Dashboard accessible after login")
+        _emit(out)
+
+    def test_model_creation(self):
+        """Quiz, question and choice fixtures were persisted"""
+        out = []
+        self.assertEqual(Quiz.objects.filter(created_by=self.shadow_user).count(), 1)
+        out.append("SUCCESS: Quiz model creation successful")
+        self.assertEqual(self.quiz.questions.count(), 1)
+        out.append("SUCCESS: Question model creation successful")
+        self.assertEqual(self.question.choices.count(), 2)
+        out.append("SUCCESS: Choice model creation successful")
+        _emit(out)